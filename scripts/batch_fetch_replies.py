@@ -8,6 +8,11 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # This script is a placeholder - actual fetching will be done via MCP tools
 # The assistant will use this as a guide for batch processing
 
@@ -16,14 +21,17 @@ THREAD_TIMESTAMPS_FILE = os.path.join(INTERMEDIATE_DIR, 'thread_timestamps.json'
 PROGRESS_FILE = os.path.join(INTERMEDIATE_DIR, 'thread_replies_progress.json')
 CHANNEL_ID = 'C04D195JVGS'
 
+def read_json(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
 def load_thread_timestamps():
-    with open(THREAD_TIMESTAMPS_FILE, 'r') as f:
-        return json.load(f)
+    return read_json(THREAD_TIMESTAMPS_FILE)
 
 def load_progress():
     if os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, 'r') as f:
-            return json.load(f)
+        return read_json(PROGRESS_FILE)
     return {
         'fetched': [],
         'failed': [],
@@ -31,6 +39,10 @@ def load_progress():
     }
 
 def save_progress(progress):
+    if orjson:
+        with open(PROGRESS_FILE, 'wb') as f:
+            f.write(orjson.dumps(progress, option=orjson.OPT_INDENT_2))
+        return
     with open(PROGRESS_FILE, 'w') as f:
         json.dump(progress, f, indent=2)
 
@@ -7,24 +7,72 @@ Outputs ForumThread[] JSON compatible with:
 """
 
 import argparse
+import asyncio
+import atexit
+import functools
 import json
+import multiprocessing
+import multiprocessing.util
 import os
 import re
 import shutil
 import sys
+import threading
 import time
+import types
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from bs4 import BeautifulSoup
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+import lxml.html
+import orjson
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from lxml.etree import ParserError
 from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    import ciso8601
+
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:  # optional C extension; stdlib fallback
+
+    def _parse_iso(raw: str) -> datetime:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode, SelectolaxError
+except ImportError:  # optional C extension; BeautifulSoup fallback
+    LexborHTMLParser = None
 
 
 class StructuredLogger:
+    # Lines collect in an in-process buffer: WARN/ERROR write it out at once,
+    # INFO every FLUSH_EVERY lines, and a background flusher drains it every
+    # FLUSH_INTERVAL_SECONDS so progress lines still show during long browser
+    # waits. Buffering here rather than in sys.stderr keeps the batching under
+    # PYTHONUNBUFFERED=1, where sys.stderr.buffer is a raw FileIO.
+    FLUSH_EVERY = 100
+    FLUSH_INTERVAL_SECONDS = 1.0
+
     def __init__(self, module: str) -> None:
         self.module = module
+        self._buffer = bytearray()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
 
     def _emit(self, level: str, message: str, **ctx: Any) -> None:
         record = {
@@ -34,7 +82,40 @@ class StructuredLogger:
             "msg": message,
             **ctx,
         }
-        print(json.dumps(record, ensure_ascii=True), file=sys.stderr, flush=True)
+        line = orjson.dumps(record) + b"\n"
+        with self._lock:
+            self._buffer += line
+            self._pending += 1
+            if level != "INFO" or self._pending >= self.FLUSH_EVERY:
+                self._write_buffer()
+            elif self._flusher is None:
+                self._start_flusher()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        if not self._buffer:
+            return
+        data = memoryview(bytes(self._buffer))
+        self._buffer.clear()
+        self._pending = 0
+        stream = sys.stderr.buffer
+        # A raw FileIO may accept only part of the data per write.
+        while data:
+            data = data[stream.write(data) or 0 :]
+        stream.flush()
+
+    def _start_flusher(self) -> None:
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.FLUSH_INTERVAL_SECONDS)
+            self.flush()
 
     def info(self, message: str, **ctx: Any) -> None:
         self._emit("INFO", message, **ctx)
@@ -55,6 +136,36 @@ DEFAULT_CONFIG_PATHS = [
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "config", "forum_sources.json")),
 ]
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+DEFAULT_CONCURRENCY = 8
+FETCH_TIMEOUT_SECONDS = 30
+# --bloom: sized for forums with 100k+ thread links.
+BLOOM_INITIAL_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.001
+# Readiness waits time out after delay + this many seconds.
+READY_WAIT_PADDING_SECONDS = 5
+RENDERERS = ("selenium", "playwright")
+DEFAULT_DESCRIPTION_SELECTORS = [
+    ".threaded-topic-body-wrapper",
+    ".qa-topic-post-box",
+    ".post__content--new-editor",
+    ".post__content",
+]
+DEFAULT_ACCEPTED_MARKERS = [".best-answer", ".label--success"]
+# libxml2-backed BeautifulSoup tree builder, used when selectolax is unavailable.
+HTML_PARSER = "lxml"
+# BeautifulSoup's get_text skips script/style strings; drop them from lexbor
+# trees so extracted text matches.
+LEXBOR_STRIP_TAGS = ["script", "style", "template"]
+
+_DIGIT_RE = re.compile(r"(\d[\d,]*)")
+_INT_RE = re.compile(r"(\d+)")
+_AUTHOR_SUFFIX_RE = re.compile(
+    r"(Accepted solution|Author|Adobe Employee|Community Expert|Correct answer)$"
+)
+_QUERY_RE = re.compile(r"\?.*$")
+_THREAD_ID_RE = re.compile(r"-\d{3,}$")
+
 
 def parse_date(value: Optional[str]) -> Optional[datetime]:
     if not value:
@@ -62,19 +173,737 @@ def parse_date(value: Optional[str]) -> Optional[datetime]:
     raw = value.strip()
     if not raw:
         return None
+    return _parse_date_raw(raw)
+
 
-    # Try common variants first.
+# Reply timestamps repeat across pages and reruns; datetimes are immutable, so
+# cached results are safe to share.
+@functools.lru_cache(maxsize=4096)
+def _parse_date_raw(raw: str) -> Optional[datetime]:
+    # Forum `datetime` attributes are ISO-8601, so try that first.
+    try:
+        return _parse_iso(raw)
+    except ValueError:
+        pass
+
+    # Unpadded dash variants (e.g. "2024-1-5") that ISO parsers reject, then
+    # slash-separated ones.
     for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d", "%m/%d/%Y"):
         try:
             return datetime.strptime(raw, fmt)
         except ValueError:
             pass
+    return None
 
-    # ISO-like fallback.
+
+def dump_json(value: Any, indent: bool = False) -> bytes:
     try:
-        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
-    except ValueError:
-        return None
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else None)
+    except orjson.JSONEncodeError:
+        # orjson rejects ints wider than 64 bits (e.g. a digit run scraped as a
+        # stat); the stdlib encoder writes them, in the same layout.
+        if indent:
+            text = json.dumps(value, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+
+def build_driver(headless: bool) -> webdriver.Chrome:
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    # Extraction only reads the DOM; skip subresources it never looks at.
+    options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+        },
+    )
+    # Return from driver.get at DOMContentLoaded; readiness is awaited explicitly.
+    options.page_load_strategy = "eager"
+
+    system_chromedriver = shutil.which("chromedriver")
+    if system_chromedriver:
+        LOGGER.info(
+            "Using system chromedriver",
+            stage="driver_init",
+            status="in_progress",
+            path=system_chromedriver,
+        )
+        try:
+            from selenium.webdriver.chrome.service import Service
+
+            driver = webdriver.Chrome(
+                service=Service(system_chromedriver), options=options
+            )
+        except Exception:
+            driver = webdriver.Chrome(
+                executable_path=system_chromedriver, options=options
+            )
+    else:
+        from webdriver_manager.chrome import ChromeDriverManager
+        from selenium.webdriver.chrome.service import Service
+
+        path = ChromeDriverManager().install()
+        LOGGER.info(
+            "Downloaded chromedriver",
+            stage="driver_init",
+            status="in_progress",
+            path=path,
+        )
+        driver = webdriver.Chrome(service=Service(path), options=options)
+
+    LOGGER.info("Webdriver ready", stage="driver_init", status="ok")
+    return driver
+
+
+def wait_until(driver: webdriver.Chrome, timeout: float, condition: Any) -> bool:
+    """Block until `condition` holds or `timeout` elapses; True if it held."""
+    try:
+        WebDriverWait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _is_session_lost(err: WebDriverException) -> bool:
+    if isinstance(err, InvalidSessionIdException):
+        return True
+    message = str(err).lower()
+    return "invalid session id" in message or "chrome not reachable" in message
+
+
+class _WorkerDumper:
+    """
+    Browser renderer owned by a single worker process. The webdriver is built
+    lazily on the first task so nothing unpicklable crosses the process boundary.
+    """
+
+    def __init__(self, headless: bool, delay: float, ready_selector: str) -> None:
+        self.headless = headless
+        self.delay = delay
+        self.ready_selector = ready_selector
+        self.driver: Optional[webdriver.Chrome] = None
+
+    def render(self, url: str) -> str:
+        try:
+            return self._render_once(url)
+        except WebDriverException as err:
+            if not _is_session_lost(err):
+                raise
+            LOGGER.warn(
+                "Webdriver session lost; restarting worker browser",
+                stage="render_worker",
+                status="partial",
+                url=url,
+                pid=os.getpid(),
+                error_class=err.__class__.__name__,
+            )
+            self.close()
+            return self._render_once(url)
+
+    def _render_once(self, url: str) -> str:
+        if self.driver is None:
+            self.driver = build_driver(self.headless)
+        self.driver.get(url)
+        wait_until(
+            self.driver,
+            self.delay + READY_WAIT_PADDING_SECONDS,
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.ready_selector)),
+        )
+        html = self.driver.page_source
+        # Long-lived sessions accumulate cookie/storage state; reset per page.
+        self.driver.delete_all_cookies()
+        return html
+
+    def close(self) -> None:
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
+
+_WORKER: Optional[_WorkerDumper] = None
+
+
+def _worker_init(headless: bool, delay: float, ready_selector: str) -> None:
+    global _WORKER
+    _WORKER = _WorkerDumper(headless, delay, ready_selector)
+    # Runs on orderly worker exit (pool shutdown) for both fork and spawn.
+    multiprocessing.util.Finalize(_WORKER, _WORKER.close, exitpriority=10)
+
+
+def _worker_render(url: str) -> str:
+    return _WORKER.render(url)
+
+
+_EXTRACTOR: Optional["ThreadExtractor"] = None
+
+
+def _parse_worker_init(
+    selectors: Dict[str, Any], status_indicators: Dict[str, List[str]], specialize: bool
+) -> None:
+    global _EXTRACTOR
+    _EXTRACTOR = ThreadExtractor(selectors, status_indicators, specialize)
+
+
+def _parse_thread(html: str, url: str, require_content: bool) -> Optional[Dict[str, Any]]:
+    return _EXTRACTOR.extract(html, url, require_content)
+
+
+def _has_validators(response: Any) -> bool:
+    return "ETag" in response.headers or "Last-Modified" in response.headers
+
+
+def _as_list(value: Any) -> List[str]:
+    values = value if isinstance(value, list) else [value]
+    return [v for v in values if v]
+
+
+class LexborTag:
+    """
+    Wraps a selectolax LexborNode in the subset of the bs4 Tag API the
+    extractors use (select_one, select, get_text, get), so both parse backends
+    share one set of extractors.
+    """
+
+    __slots__ = ("node",)
+
+    def __init__(self, node: "LexborNode") -> None:
+        self.node = node
+
+    def select_one(self, selector: str) -> Optional["LexborTag"]:
+        node = self.node.css_first(selector)
+        if node is None:
+            return None
+        if node.mem_id == self.node.mem_id:
+            # Lexbor can match the context node itself; bs4 only descendants.
+            tags = self.select(selector)
+            return tags[0] if tags else None
+        return LexborTag(node)
+
+    def select(self, selector: str) -> List["LexborTag"]:
+        # Lexbor yields a node once per matching entry of a selector list and
+        # includes the context node; bs4 yields each descendant once.
+        seen = {self.node.mem_id}
+        tags: List[LexborTag] = []
+        for node in self.node.css(selector):
+            if node.mem_id not in seen:
+                seen.add(node.mem_id)
+                tags.append(LexborTag(node))
+        return tags
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if not (strip and separator):
+            return self.node.text(separator=separator, strip=strip)
+        # Like bs4, drop strings that strip to nothing (inter-element
+        # whitespace) instead of joining them as empty parts.
+        parts = []
+        for node in self.node.traverse(include_text=True):
+            if node.is_text_node:
+                text = node.text_content.strip()
+                if text:
+                    parts.append(text)
+        return separator.join(parts)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        value = self.node.attributes.get(name)
+        return default if value is None else value
+
+
+# A parsed page or element from either backend.
+Node = Union[Tag, LexborTag]
+
+
+def parse_lexbor(html: str) -> LexborTag:
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(LEXBOR_STRIP_TAGS, recursive=True)
+    return LexborTag(tree.root)
+
+
+def lexbor_supports(selectors: List[str]) -> bool:
+    """True if selectolax is installed and lexbor can compile every selector."""
+    if LexborHTMLParser is None:
+        return False
+    probe = LexborHTMLParser("")
+    try:
+        for selector in selectors:
+            probe.css(selector)
+    except SelectolaxError:
+        return False
+    return True
+
+
+def _first_match_source(selectors: List[str], get_text: str, skip_empty: bool) -> List[str]:
+    # Unrolled "first matching selector wins" block with the selectors baked in
+    # as literals.
+    lines: List[str] = []
+    for selector in selectors:
+        lines += [f"    el = soup.select_one({selector!r})", "    if el:"]
+        if skip_empty:
+            lines += [f"        text = {get_text}", "        if text:", "            return text"]
+        else:
+            lines += [f"        return {get_text}"]
+    return lines
+
+
+def _post_date_source(selectors: List[str]) -> List[str]:
+    lines: List[str] = []
+    for selector in selectors:
+        lines += [
+            f"    el = soup.select_one({selector!r})",
+            '    dt = el.get("datetime") if el else None',
+            "    if dt:",
+            "        parsed = parse_date(dt)",
+            '        return parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else dt',
+        ]
+    return lines
+
+
+def build_specialized_extractors(
+    title_selectors: List[str],
+    author_selectors: List[str],
+    date_selector: str,
+    description_selectors: List[str],
+) -> Dict[str, Any]:
+    """
+    Generates per-forum versions of the scalar extractors with the resolved
+    selectors inlined and selector-list loops unrolled. Each generated function
+    returns what the generic ForumDumper method of the same name returns.
+    """
+    text = "el.get_text(strip=True)"
+    functions = {
+        "_extract_title": [
+            *_first_match_source(title_selectors, text, skip_empty=True),
+            *_first_match_source(["title"], 'el.get_text(strip=True).split(" | ")[0].strip()', skip_empty=False),
+        ],
+        "_extract_author": [
+            *_first_match_source(author_selectors, text, skip_empty=True),
+            *_first_match_source([".author-info"], text, skip_empty=False),
+        ],
+        "_extract_post_date": _post_date_source([date_selector, "time[datetime]"]),
+        "_extract_description": _first_match_source(
+            description_selectors, 'el.get_text(separator="\\n", strip=True)', skip_empty=False
+        ),
+    }
+
+    source: List[str] = []
+    for name, body in functions.items():
+        source += [f"def {name}(self, soup):", *body, '    return ""', ""]
+    has_content = " or ".join(f"soup.select_one({sel!r}) is not None" for sel in title_selectors)
+    source += ["def _has_thread_content(self, soup):", f"    return {has_content or 'False'}"]
+
+    namespace: Dict[str, Any] = {"parse_date": parse_date}
+    exec(compile("\n".join(source), "<forum_dump specialized extractors>", "exec"), namespace)
+    return {name: namespace[name] for name in [*functions, "_has_thread_content"]}
+
+
+class SelectorBatch:
+    """
+    Matches several named CSS selectors against a subtree in one traversal.
+    The combined selector list walks the subtree once; only the nodes it yields
+    are classified against the individual selectors. Buckets keep document
+    order, so bucket[0] is what select_one would have returned. Lexbor trees
+    are matched per selector, since lexbor's native matching is cheaper than
+    classifying nodes from Python.
+    """
+
+    def __init__(self, selectors: Dict[str, str]) -> None:
+        self.selectors = selectors
+        self._patterns = {name: soupsieve.compile(sel) for name, sel in selectors.items()}
+        self._combined = soupsieve.compile(", ".join(selectors.values()))
+
+    def scan(self, root: Node) -> Dict[str, List[Node]]:
+        if isinstance(root, LexborTag):
+            return {name: root.select(sel) for name, sel in self.selectors.items()}
+        buckets: Dict[str, List[Node]] = {name: [] for name in self._patterns}
+        for node in self._combined.select(root):
+            for name, pattern in self._patterns.items():
+                if pattern.match(node):
+                    buckets[name].append(node)
+        return buckets
+
+
+class PlaywrightRenderer:
+    """
+    Renders JS-dependent pages through Playwright's async API: one headless
+    Chromium, one shared context, and up to `max_pages` concurrent pages.
+    Playwright is an optional dependency, imported on start().
+    """
+
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+    def __init__(self, headless: bool, delay: float, ready_selector: str, max_pages: int) -> None:
+        self.headless = headless
+        self.delay = delay
+        self.ready_selector = ready_selector
+        self.max_pages = max_pages
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._context: Any = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._timeout_error: Any = None
+
+    async def start(self) -> None:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import async_playwright
+
+        self._timeout_error = PlaywrightTimeoutError
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless, args=["--no-sandbox", "--disable-dev-shm-usage"]
+        )
+        self._context = await self._browser.new_context(user_agent=USER_AGENT)
+        await self._context.route("**/*", self._route)
+        LOGGER.info(
+            "Playwright browser ready",
+            stage="driver_init",
+            status="ok",
+            max_pages=self.max_pages,
+        )
+
+    async def _route(self, route: Any) -> None:
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def render(self, url: str) -> str:
+        async with self._semaphore:
+            page = await self._context.new_page()
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                try:
+                    await page.wait_for_selector(
+                        self.ready_selector,
+                        state="attached",
+                        timeout=(self.delay + READY_WAIT_PADDING_SECONDS) * 1000,
+                    )
+                except self._timeout_error:
+                    pass
+                return await page.content()
+            finally:
+                await page.close()
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        LOGGER.info("Playwright browser closed", stage="run", status="ok")
+
+
+class ConcurrencyLimiter:
+    """
+    Async context manager bounding in-flight requests (semaphore) and spacing
+    request starts to a steady rate (token bucket with a capacity of one).
+    Must be created inside the running event loop.
+    """
+
+    def __init__(self, concurrency: int, rate_per_second: Optional[float]) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._interval = 1.0 / rate_per_second if rate_per_second else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self._semaphore.acquire()
+        try:
+            await self._take_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+    async def _take_token(self) -> None:
+        if not self._interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class ThreadExtractor:
+    """
+    Turns thread page HTML into ForumThread dicts using one forum's selectors.
+    Holds no browser or session state, so parse worker processes can each
+    build their own from the forum config.
+    """
+
+    def __init__(
+        self,
+        selectors: Dict[str, Any],
+        status_indicators: Dict[str, List[str]],
+        specialize: bool = False,
+    ) -> None:
+        # The config is fixed for the run; resolve defaults and list-vs-scalar
+        # shapes once instead of on every page.
+        get = selectors.get
+        self.title_selectors = _as_list(get("title"))
+        self._author_selectors = _as_list(get("author"))
+        self._date_selector = get("date", "time[datetime]")
+        self._description_selectors = _as_list(get("description", DEFAULT_DESCRIPTION_SELECTORS))
+        self._tag_selector = get("tags", 'a[href*="search_type=tag"]')
+        self._status_label_selector = get("status_labels", ".label-component")
+        self._reply_selector = get("reply_container", ".threaded-reply-item")
+        self._reply_body_selector = get("reply_body", ".threaded-reply-body-wrapper")
+        self._reply_author_selector = get("reply_author", ".author-info")
+        self._accepted_markers = _as_list(get("accepted_marker", DEFAULT_ACCEPTED_MARKERS))
+        self._resolved_terms = [s.lower() for s in status_indicators.get("resolved", [])]
+        self._unresolved_terms = [s.lower() for s in status_indicators.get("unresolved", [])]
+        self._reply_batch = self._build_reply_batch()
+        self._page_batch = self._build_page_batch()
+        self.use_lexbor = lexbor_supports(self._selector_list())
+        self.specialize = specialize
+        if self.specialize:
+            self._specialize_extractors()
+
+    def _build_reply_batch(self) -> SelectorBatch:
+        selectors = {
+            "author": self._reply_author_selector,
+            "time": "time[datetime]",
+            "body": self._reply_body_selector,
+            "labels": self._status_label_selector,
+            "like": '[aria-label*="like"], [aria-label*="kudo"]',
+        }
+        # An empty accepted_marker list means no reply is marked by class; an
+        # empty selector would not compile.
+        if self._accepted_markers:
+            selectors["accepted"] = ", ".join(self._accepted_markers)
+        return SelectorBatch(selectors)
+
+    def _build_page_batch(self) -> SelectorBatch:
+        # Only lookups that need every match on the page; stats stop at the
+        # first hit, so they stay short-circuiting select_one calls.
+        return SelectorBatch(
+            {
+                "labels": self._status_label_selector,
+                "best_answer": ".best-answer",
+                "tags": self._tag_selector,
+            }
+        )
+
+    def _selector_list(self) -> List[str]:
+        return [
+            *self.title_selectors,
+            *self._author_selectors,
+            self._date_selector,
+            *self._description_selectors,
+            self._reply_selector,
+            *self._reply_batch.selectors.values(),
+            *self._page_batch.selectors.values(),
+        ]
+
+    def _specialize_extractors(self) -> None:
+        # Instance attributes shadow the generic methods for this extractor only.
+        extractors = build_specialized_extractors(
+            self.title_selectors,
+            self._author_selectors,
+            self._date_selector,
+            self._description_selectors,
+        )
+        for name, function in extractors.items():
+            setattr(self, name, types.MethodType(function, self))
+
+    def _parse(self, html: str) -> Node:
+        if self.use_lexbor:
+            return parse_lexbor(html)
+        return BeautifulSoup(html, HTML_PARSER)
+
+    def extract(self, html: str, url: str, require_content: bool = True) -> Optional[Dict[str, Any]]:
+        """None when `require_content` is set and no title selector matches."""
+        soup = self._parse(html)
+        if require_content and not self._has_thread_content(soup):
+            return None
+        return self._build_thread(soup, url)
+
+    def _select_text(self, soup: Node, selectors: List[str]) -> str:
+        for selector in selectors:
+            el = soup.select_one(selector)
+            if el:
+                text = el.get_text(strip=True)
+                if text:
+                    return text
+        return ""
+
+    def _extract_title(self, soup: Node) -> str:
+        title = self._select_text(soup, self.title_selectors)
+        if title:
+            return title
+        title_tag = soup.select_one("title")
+        if title_tag:
+            return title_tag.get_text(strip=True).split(" | ")[0].strip()
+        return ""
+
+    def _extract_author(self, soup: Node) -> str:
+        author = self._select_text(soup, self._author_selectors)
+        if author:
+            return author
+        fallback = soup.select_one(".author-info")
+        if fallback:
+            return fallback.get_text(strip=True)
+        return ""
+
+    def _extract_post_date(self, soup: Node) -> str:
+        date_el = soup.select_one(self._date_selector)
+        if date_el and date_el.get("datetime"):
+            dt = date_el.get("datetime")
+            parsed = parse_date(dt)
+            return parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else dt
+
+        fallback = soup.select_one("time[datetime]")
+        if fallback and fallback.get("datetime"):
+            dt = fallback.get("datetime")
+            parsed = parse_date(dt)
+            return parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else dt
+
+        return ""
+
+    def _extract_description(self, soup: Node) -> str:
+        for selector in self._description_selectors:
+            el = soup.select_one(selector)
+            if el:
+                return el.get_text(separator="\n", strip=True)
+        return ""
+
+    def _scan_page(self, soup: Node) -> Dict[str, Any]:
+        # One pass over the page for status labels, the best-answer marker and
+        # tags; _extract_status reads from the result.
+        found = self._page_batch.scan(soup)
+
+        tags: List[str] = []
+        for el in found["tags"]:
+            tag = el.get_text(strip=True)
+            if tag and tag not in tags:
+                tags.append(tag)
+
+        return {
+            "labels": [el.get_text(strip=True).lower() for el in found["labels"]],
+            "best_answer": bool(found["best_answer"]),
+            "tags": tags,
+        }
+
+    def _extract_stat(self, soup: Node, keyword: str) -> int:
+        el = soup.select_one(f'[aria-label*="{keyword}"]')
+        if el:
+            text = el.get("aria-label", "") + " " + el.get_text(strip=True)
+            match = _DIGIT_RE.search(text)
+            if match:
+                return int(match.group(1).replace(",", ""))
+
+        for selector in [f".{keyword}-count", f".{keyword}s", f'[class*="{keyword}"]']:
+            el = soup.select_one(selector)
+            if el:
+                match = _DIGIT_RE.search(el.get_text(strip=True))
+                if match:
+                    return int(match.group(1).replace(",", ""))
+        return 0
+
+    def _extract_status(self, page: Dict[str, Any]) -> str:
+        labels = page["labels"]
+
+        for label in labels:
+            if any(term in label for term in self._resolved_terms):
+                return "resolved"
+        for label in labels:
+            if any(term in label for term in self._unresolved_terms):
+                return "unresolved"
+
+        if page["best_answer"]:
+            return "resolved"
+        return "unknown"
+
+    def _extract_replies(self, soup: Node) -> List[Dict[str, Any]]:
+        replies: List[Dict[str, Any]] = []
+
+        for item in soup.select(self._reply_selector):
+            reply: Dict[str, Any] = {}
+            found = self._reply_batch.scan(item)
+
+            author_el = found["author"][0] if found["author"] else None
+            author_text = author_el.get_text(strip=True) if author_el else ""
+            author_text = _AUTHOR_SUFFIX_RE.sub("", author_text).strip()
+            reply["author"] = author_text
+
+            time_el = found["time"][0] if found["time"] else None
+            if time_el and time_el.get("datetime"):
+                parsed = parse_date(time_el.get("datetime"))
+                reply["date"] = parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else time_el.get("datetime")
+            else:
+                reply["date"] = ""
+
+            body_el = found["body"][0] if found["body"] else None
+            reply["text"] = body_el.get_text(separator="\n", strip=True) if body_el else ""
+
+            is_accepted = bool(found.get("accepted"))
+            for label in found["labels"]:
+                if "accepted solution" in label.get_text(strip=True).lower():
+                    is_accepted = True
+            reply["is_accepted"] = is_accepted
+
+            like_el = found["like"][0] if found["like"] else None
+            if like_el:
+                match = _INT_RE.search(like_el.get("aria-label", "") + " " + like_el.get_text(strip=True))
+                reply["likes"] = int(match.group(1)) if match else 0
+            else:
+                reply["likes"] = 0
+
+            if reply.get("text") or reply.get("author"):
+                replies.append(reply)
+
+        return replies
+
+    def _build_thread(self, soup: Node, url: str) -> Dict[str, Any]:
+        page = self._scan_page(soup)
+        thread = {
+            "url": url,
+            "title": self._extract_title(soup),
+            "author": self._extract_author(soup),
+            "date_posted": self._extract_post_date(soup),
+            "description": self._extract_description(soup),
+            "tags": page["tags"],
+            "views": self._extract_stat(soup, "view"),
+            "replies_count": self._extract_stat(soup, "repl"),
+            "likes": self._extract_stat(soup, "like") or self._extract_stat(soup, "kudo"),
+            "status": self._extract_status(page),
+            "accepted_answer": None,
+            "comments": [],
+            "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        replies = self._extract_replies(soup)
+        for reply in replies:
+            if reply.get("is_accepted"):
+                thread["accepted_answer"] = reply
+            thread["comments"].append(reply)
+        thread["replies_count"] = thread["replies_count"] or len(thread["comments"])
+        return thread
+
+    def _has_thread_content(self, soup: Node) -> bool:
+        return any(soup.select_one(selector) for selector in self.title_selectors)
 
 
 class ForumDumper:
@@ -87,6 +916,13 @@ class ForumDumper:
         delay: Optional[float] = None,
         test_limit: Optional[int] = None,
         since: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        workers: Optional[int] = None,
+        renderer: Optional[str] = None,
+        specialize: bool = False,
+        parse_workers: Optional[int] = None,
+        http_cache: Optional[str] = None,
+        bloom: bool = False,
     ) -> None:
         self.forum_key = forum_key
         self.raw_config = self._load_config(config_path)
@@ -107,9 +943,29 @@ class ForumDumper:
         self.delay = float(self.defaults.get("delay_seconds", 2)) if delay is None else delay
         self.test_limit = test_limit
         self.since_dt = parse_date(since)
+        self.concurrency = max(1, concurrency or int(self.defaults.get("concurrency", DEFAULT_CONCURRENCY)))
+        self.workers = max(1, workers or int(self.defaults.get("browser_workers", 1)))
+        self.requires_js = bool(self.forum.get("requires_js", False))
+        self.renderer = renderer or self.defaults.get("renderer", "selenium")
+        if self.renderer not in RENDERERS:
+            raise ValueError(f"Unknown renderer '{self.renderer}'. Expected one of: {', '.join(RENDERERS)}")
+        default_parse_workers = int(self.defaults.get("parse_workers", os.cpu_count() or 1))
+        self.parse_workers = max(0, default_parse_workers if parse_workers is None else parse_workers)
+        self.specialize = specialize
+        self.http_cache = http_cache or self.defaults.get("http_cache")
+        self.bloom = bloom
         self.driver = None
+        self._limiter: Optional[ConcurrencyLimiter] = None
+        self._browser_executor: Optional[Executor] = None
+        self._playwright: Optional[PlaywrightRenderer] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._intern_cache: Dict[str, str] = {}
+        self._checkpoint_fp: Optional[BinaryIO] = None
 
         self._validate_forum_config()
+        self._url_pattern = self._thread_url_regex()
+        self._extractor = ThreadExtractor(self.selectors, self.status_indicators, self.specialize)
+        self._resolve_selectors()
         self._init_driver()
 
         LOGGER.info(
@@ -120,6 +976,15 @@ class ForumDumper:
             base_url=self.base_url,
             headless=self.headless,
             delay=self.delay,
+            concurrency=self.concurrency,
+            workers=self.workers,
+            renderer=self.renderer,
+            parser="selectolax" if self._extractor.use_lexbor else "bs4",
+            parse_workers=self.parse_workers,
+            requires_js=self.requires_js,
+            specialize=self.specialize,
+            http_cache=self.http_cache,
+            bloom=self.bloom,
             max_pages=self.max_pages,
             test_limit=self.test_limit,
             since=since,
@@ -141,8 +1006,8 @@ class ForumDumper:
 
     def _load_config(self, explicit_path: Optional[str]) -> Dict[str, Any]:
         path = self._resolve_config_path(explicit_path)
-        with open(path, "r", encoding="utf-8") as handle:
-            config = json.load(handle)
+        with open(path, "rb") as handle:
+            config = orjson.loads(handle.read())
         LOGGER.info("Loaded config", stage="init", status="ok", config_path=path)
         return config
 
@@ -168,59 +1033,43 @@ class ForumDumper:
             )
 
     def _init_driver(self) -> None:
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        )
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-        system_chromedriver = shutil.which("chromedriver")
-        if system_chromedriver:
-            LOGGER.info(
-                "Using system chromedriver",
-                stage="driver_init",
-                status="in_progress",
-                path=system_chromedriver,
-            )
-            try:
-                from selenium.webdriver.chrome.service import Service
+        self.driver = build_driver(self.headless)
 
-                self.driver = webdriver.Chrome(
-                    service=Service(system_chromedriver), options=options
-                )
-            except Exception:
-                self.driver = webdriver.Chrome(
-                    executable_path=system_chromedriver, options=options
-                )
-        else:
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.chrome.service import Service
-
-            path = ChromeDriverManager().install()
-            LOGGER.info(
-                "Downloaded chromedriver",
-                stage="driver_init",
-                status="in_progress",
-                path=path,
-            )
-            self.driver = webdriver.Chrome(service=Service(path), options=options)
-
-        LOGGER.info("Webdriver ready", stage="driver_init", status="ok")
+    def _resolve_selectors(self) -> None:
+        get = self.selectors.get
+        self._load_more_selector = get("load_more_button", ".btn--load-more")
+        # A thread page counts as loaded once any title selector is present.
+        self._ready_selector = ", ".join(self._extractor.title_selectors)
 
     def _thread_url_regex(self) -> re.Pattern:
         pattern = self.selectors.get("thread_url_pattern", "/{forum_slug}/[^/]+-\\d+")
         pattern = pattern.replace("{forum_slug}", re.escape(self.forum_slug))
         return re.compile(pattern)
 
+    def _thread_hrefs(self, html: str) -> List[str]:
+        # Link harvesting only needs href attributes, so skip building a soup.
+        try:
+            hrefs = lxml.html.fromstring(html).xpath("//a/@href")
+        except ParserError:
+            return []
+        return [href for href in hrefs if self._url_pattern.search(href)]
+
+    def _seen_urls(self) -> Any:
+        if not self.bloom:
+            return set()
+        # Optional dependency, imported only with --bloom. About 10 bits per
+        # key instead of a full string; a false positive drops that thread URL.
+        from pybloom_live import ScalableBloomFilter
+
+        return ScalableBloomFilter(
+            initial_capacity=BLOOM_INITIAL_CAPACITY,
+            error_rate=BLOOM_ERROR_RATE,
+            mode=ScalableBloomFilter.LARGE_SET_GROWTH,
+        )
+
     def collect_question_urls(self) -> List[str]:
         urls: List[str] = []
-        seen = set()
+        seen = self._seen_urls()
 
         LOGGER.info(
             "Starting URL collection",
@@ -229,27 +1078,32 @@ class ForumDumper:
             base_url=self.base_url,
         )
         self.driver.get(self.base_url)
-        time.sleep(self.delay + 3)
+        wait_until(
+            self.driver,
+            self.delay + READY_WAIT_PADDING_SECONDS,
+            EC.presence_of_element_located((By.CSS_SELECTOR, self._load_more_selector)),
+        )
 
         click_count = 0
         stale_rounds = 0
-        url_pattern = self._thread_url_regex()
 
         while True:
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            links = soup.find_all("a", href=url_pattern)
             new_this_round = 0
 
-            for link in links:
-                href = link.get("href", "")
-                href = re.sub(r"\?.*$", "", href)
+            for href in self._thread_hrefs(self.driver.page_source):
+                href = _QUERY_RE.sub("", href)
                 if not href.startswith("http"):
                     href = self.thread_base + "/" + href.lstrip("/")
-                if not re.search(r"-\d{3,}$", href):
+                # Key on the canonical form so trailing-slash, fragment and
+                # host-case variants of one thread are fetched once.
+                parts = urlsplit(href)
+                path = parts.path.rstrip("/")
+                if not _THREAD_ID_RE.search(path):
                     continue
-                if href not in seen:
-                    seen.add(href)
-                    urls.append(href)
+                key = f"{parts.scheme}://{parts.netloc.lower()}{path}"
+                if key not in seen:
+                    seen.add(key)
+                    urls.append(urlunsplit((parts.scheme, parts.netloc, path, "", "")))
                     new_this_round += 1
 
             if new_this_round > 0:
@@ -297,14 +1151,20 @@ class ForumDumper:
                 )
                 break
 
-            button_selector = self.selectors.get("load_more_button", ".btn--load-more")
+            button_selector = self._load_more_selector
             try:
                 btn = self.driver.find_element(By.CSS_SELECTOR, button_selector)
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
                 time.sleep(0.5)
+                prev_count = len(self.driver.find_elements(By.CSS_SELECTOR, "a"))
                 btn.click()
                 click_count += 1
-                time.sleep(self.delay)
+                # No new links before the timeout is picked up as a stale round.
+                wait_until(
+                    self.driver,
+                    self.delay + READY_WAIT_PADDING_SECONDS,
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, "a")) > prev_count,
+                )
             except Exception as err:
                 LOGGER.warn(
                     "Load more button unavailable; stopping URL collection",
@@ -326,194 +1186,173 @@ class ForumDumper:
         )
         return urls
 
-    def _select_text(self, soup: BeautifulSoup, selector_config: Any) -> str:
-        selectors = selector_config if isinstance(selector_config, list) else [selector_config]
-        for selector in selectors:
-            if not selector:
-                continue
-            el = soup.select_one(selector)
-            if el:
-                text = el.get_text(strip=True)
-                if text:
-                    return text
-        return ""
-
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        title = self._select_text(soup, self.selectors.get("title"))
-        if title:
-            return title
-        title_tag = soup.find("title")
-        if title_tag:
-            return title_tag.get_text(strip=True).split(" | ")[0].strip()
-        return ""
-
-    def _extract_author(self, soup: BeautifulSoup) -> str:
-        primary_selector = self.selectors.get("author")
-        if primary_selector:
-            author = self._select_text(soup, primary_selector)
-            if author:
-                return author
-        fallback = soup.select_one(".author-info")
-        if fallback:
-            return fallback.get_text(strip=True)
-        return ""
-
-    def _extract_post_date(self, soup: BeautifulSoup) -> str:
-        date_selector = self.selectors.get("date", "time[datetime]")
-        date_el = soup.select_one(date_selector)
-        if date_el and date_el.get("datetime"):
-            dt = date_el.get("datetime")
-            parsed = parse_date(dt)
-            return parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else dt
-
-        fallback = soup.select_one("time[datetime]")
-        if fallback and fallback.get("datetime"):
-            dt = fallback.get("datetime")
-            parsed = parse_date(dt)
-            return parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else dt
-
-        return ""
-
-    def _extract_description(self, soup: BeautifulSoup) -> str:
-        selectors = self.selectors.get(
-            "description",
-            [
-                ".threaded-topic-body-wrapper",
-                ".qa-topic-post-box",
-                ".post__content--new-editor",
-                ".post__content",
-            ],
+    def _http_session(self, **kwargs: Any) -> aiohttp.ClientSession:
+        if not self.http_cache:
+            return aiohttp.ClientSession(**kwargs)
+        # Optional dependency, imported only when response caching is enabled.
+        from aiohttp_client_cache import CachedSession, SQLiteBackend
+
+        cache_dir = os.path.dirname(self.http_cache)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        # Entries never expire; every fetch revalidates (refresh=True) with
+        # If-None-Match / If-Modified-Since and reuses the body on a 304. Pages
+        # without ETag or Last-Modified cannot be revalidated, so they are not
+        # stored and always fetch in full.
+        backend = SQLiteBackend(self.http_cache, expire_after=-1, filter_fn=_has_validators)
+        return CachedSession(cache=backend, **kwargs)
+
+    async def _fetch_html(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        fetch_kwargs = {"refresh": True} if self.http_cache else {}
+        async with self._limiter:
+            async with session.get(url, **fetch_kwargs) as response:
+                if response.status != 200:
+                    LOGGER.warn(
+                        "Unexpected HTTP status; falling back to browser",
+                        stage="fetch_html",
+                        status="partial",
+                        url=url,
+                        http_status=response.status,
+                    )
+                    return None
+                return await response.text()
+
+    def _render_with_browser(self, url: str) -> str:
+        self.driver.get(url)
+        wait_until(
+            self.driver,
+            self.delay + READY_WAIT_PADDING_SECONDS,
+            EC.presence_of_element_located((By.CSS_SELECTOR, self._ready_selector)),
         )
-        if not isinstance(selectors, list):
-            selectors = [selectors]
-        for selector in selectors:
-            el = soup.select_one(selector)
-            if el:
-                return el.get_text(separator="\n", strip=True)
-        return ""
+        return self.driver.page_source
 
-    def _extract_tags(self, soup: BeautifulSoup) -> List[str]:
-        tags: List[str] = []
-        tag_selector = self.selectors.get("tags", 'a[href*="search_type=tag"]')
-        for el in soup.select(tag_selector):
-            tag = el.get_text(strip=True)
-            if tag and tag not in tags:
-                tags.append(tag)
-        return tags
-
-    def _extract_stat(self, soup: BeautifulSoup, keyword: str) -> int:
-        el = soup.select_one(f'[aria-label*="{keyword}"]')
-        if el:
-            text = el.get("aria-label", "") + " " + el.get_text(strip=True)
-            match = re.search(r"(\d[\d,]*)", text)
-            if match:
-                return int(match.group(1).replace(",", ""))
-
-        for selector in [f".{keyword}-count", f".{keyword}s", f'[class*="{keyword}"]']:
-            el = soup.select_one(selector)
-            if el:
-                match = re.search(r"(\d[\d,]*)", el.get_text(strip=True))
-                if match:
-                    return int(match.group(1).replace(",", ""))
-        return 0
-
-    def _extract_status(self, soup: BeautifulSoup) -> str:
-        status_label_selector = self.selectors.get("status_labels", ".label-component")
-        labels = [el.get_text(strip=True).lower() for el in soup.select(status_label_selector)]
-
-        resolved_terms = [s.lower() for s in self.status_indicators.get("resolved", [])]
-        unresolved_terms = [s.lower() for s in self.status_indicators.get("unresolved", [])]
-
-        for label in labels:
-            if any(term in label for term in resolved_terms):
-                return "resolved"
-        for label in labels:
-            if any(term in label for term in unresolved_terms):
-                return "unresolved"
-
-        if soup.select_one(".best-answer"):
-            return "resolved"
-        return "unknown"
-
-    def _extract_replies(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        replies: List[Dict[str, Any]] = []
-        reply_selector = self.selectors.get("reply_container", ".threaded-reply-item")
-        body_selector = self.selectors.get("reply_body", ".threaded-reply-body-wrapper")
-        author_selector = self.selectors.get("reply_author", ".author-info")
-        accepted_markers = self.selectors.get("accepted_marker", [".best-answer", ".label--success"])
-        accepted_markers = accepted_markers if isinstance(accepted_markers, list) else [accepted_markers]
-
-        for item in soup.select(reply_selector):
-            reply: Dict[str, Any] = {}
-
-            author_el = item.select_one(author_selector)
-            author_text = author_el.get_text(strip=True) if author_el else ""
-            author_text = re.sub(
-                r"(Accepted solution|Author|Adobe Employee|Community Expert|Correct answer)$",
-                "",
-                author_text,
-            ).strip()
-            reply["author"] = author_text
-
-            time_el = item.select_one("time[datetime]")
-            if time_el and time_el.get("datetime"):
-                parsed = parse_date(time_el.get("datetime"))
-                reply["date"] = parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else time_el.get("datetime")
-            else:
-                reply["date"] = ""
-
-            body_el = item.select_one(body_selector)
-            reply["text"] = body_el.get_text(separator="\n", strip=True) if body_el else ""
-
-            is_accepted = any(item.select_one(marker) is not None for marker in accepted_markers)
-            for label in item.select(self.selectors.get("status_labels", ".label-component")):
-                if "accepted solution" in label.get_text(strip=True).lower():
-                    is_accepted = True
-            reply["is_accepted"] = is_accepted
-
-            like_el = item.select_one('[aria-label*="like"], [aria-label*="kudo"]')
-            if like_el:
-                match = re.search(
-                    r"(\d+)", like_el.get("aria-label", "") + " " + like_el.get_text(strip=True)
-                )
-                reply["likes"] = int(match.group(1)) if match else 0
-            else:
-                reply["likes"] = 0
-
-            if reply.get("text") or reply.get("author"):
-                replies.append(reply)
-
-        return replies
+    async def _start_renderer(self) -> None:
+        if self.renderer == "playwright":
+            # One browser serves `workers` concurrent pages; no process pool needed.
+            self._playwright = PlaywrightRenderer(
+                self.headless, self.delay, self._ready_selector, self.workers
+            )
+            await self._playwright.start()
+        elif self.workers > 1:
+            # Selenium sessions are not thread-safe, so each render worker is a
+            # separate process owning its own headless browser.
+            self._browser_executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_worker_init,
+                initargs=(self.headless, self.delay, self._ready_selector),
+            )
+        else:
+            # The webdriver is a single session; browser fallbacks are serialized.
+            self._browser_executor = ThreadPoolExecutor(max_workers=1)
+
+    async def _stop_renderer(self) -> None:
+        if self._playwright is not None:
+            await self._playwright.close()
+            self._playwright = None
+        if self._browser_executor is not None:
+            self._browser_executor.shutdown(wait=True)
+            self._browser_executor = None
+
+    async def _render(self, url: str) -> str:
+        if self._playwright is not None:
+            return await self._playwright.render(url)
+        loop = asyncio.get_running_loop()
+        render = _worker_render if self.workers > 1 else self._render_with_browser
+        return await loop.run_in_executor(self._browser_executor, render, url)
+
+    def _start_parse_pool(self) -> None:
+        if self.parse_workers < 1:
+            return
+        # Parsing is CPU-bound; running it in worker processes keeps the event
+        # loop free to drive fetches while pages are being extracted.
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_parse_worker_init,
+            initargs=(self.selectors, self.status_indicators, self.specialize),
+        )
 
-    def extract_thread(self, url: str) -> Dict[str, Any]:
+    def _stop_parse_pool(self) -> None:
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+
+    async def _extract(self, html: str, url: str, require_content: bool) -> Optional[Dict[str, Any]]:
+        if self._parse_pool is None:
+            return self._extractor.extract(html, url, require_content)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, _parse_thread, html, url, require_content)
+
+    def _intern(self, value: str) -> str:
+        return self._intern_cache.setdefault(value, value)
+
+    def _intern_thread(self, thread: Dict[str, Any]) -> None:
+        # Authors, dates, statuses and tags repeat across the run's threads, and
+        # thread dicts unpickled from parse workers carry fresh copies of each;
+        # keep one shared string per distinct value. accepted_answer points at
+        # one of the comment dicts, so interning comments covers it.
+        intern = self._intern
+        thread["author"] = intern(thread["author"])
+        thread["date_posted"] = intern(thread["date_posted"])
+        thread["status"] = intern(thread["status"])
+        thread["tags"] = [intern(tag) for tag in thread["tags"]]
+        for reply in thread["comments"]:
+            reply["author"] = intern(reply["author"])
+            reply["date"] = intern(reply["date"])
+
+    async def _extract_indexed(
+        self,
+        slots: asyncio.Semaphore,
+        session: aiohttp.ClientSession,
+        index: int,
+        url: str,
+        total: int,
+    ) -> Tuple[int, Dict[str, Any]]:
+        async with slots:
+            try:
+                thread = await self._extract_thread_async(session, url, index + 1, total)
+            except Exception as err:
+                thread = {
+                    "url": url,
+                    "error": str(err),
+                    "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                }
+        return index, thread
+
+    async def _extract_thread_async(
+        self, session: aiohttp.ClientSession, url: str, position: int, total: int
+    ) -> Dict[str, Any]:
+        LOGGER.info(
+            "Extracting thread",
+            stage="run",
+            status="in_progress",
+            position=position,
+            total=total,
+            url=url,
+        )
         started = time.time()
         try:
-            self.driver.get(url)
-            time.sleep(self.delay)
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-
-            thread = {
-                "url": url,
-                "title": self._extract_title(soup),
-                "author": self._extract_author(soup),
-                "date_posted": self._extract_post_date(soup),
-                "description": self._extract_description(soup),
-                "tags": self._extract_tags(soup),
-                "views": self._extract_stat(soup, "view"),
-                "replies_count": self._extract_stat(soup, "repl"),
-                "likes": self._extract_stat(soup, "like") or self._extract_stat(soup, "kudo"),
-                "status": self._extract_status(soup),
-                "accepted_answer": None,
-                "comments": [],
-                "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-
-            replies = self._extract_replies(soup)
-            for reply in replies:
-                if reply.get("is_accepted"):
-                    thread["accepted_answer"] = reply
-                thread["comments"].append(reply)
-            thread["replies_count"] = thread["replies_count"] or len(thread["comments"])
+            html = None
+            if not self.requires_js:
+                try:
+                    html = await self._fetch_html(session, url)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                    LOGGER.warn(
+                        "HTTP fetch failed; falling back to browser",
+                        stage="fetch_html",
+                        status="partial",
+                        url=url,
+                        error_class=err.__class__.__name__,
+                        error_message=str(err),
+                    )
+
+            thread = await self._extract(html, url, require_content=True) if html else None
+            rendered = thread is None
+            if rendered:
+                html = await self._render(url)
+                thread = await self._extract(html, url, require_content=False)
+            self._intern_thread(thread)
 
             LOGGER.info(
                 "Thread extracted",
@@ -523,6 +1362,7 @@ class ForumDumper:
                 elapsed_ms=int((time.time() - started) * 1000),
                 comments=len(thread["comments"]),
                 has_accepted=thread["accepted_answer"] is not None,
+                rendered=rendered,
             )
             return thread
         except Exception as err:
@@ -541,14 +1381,26 @@ class ForumDumper:
                 "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             }
 
-    def _save(self, threads: List[Dict[str, Any]], output_file: str, checkpoint: bool = False) -> None:
-        with open(output_file, "w", encoding="utf-8") as handle:
-            json.dump(threads, handle, indent=2, ensure_ascii=False)
+    def _append_checkpoint(self, threads: List[Dict[str, Any]], total: int) -> None:
+        for thread in threads:
+            self._checkpoint_fp.write(dump_json(thread) + b"\n")
+        self._checkpoint_fp.flush()
+        LOGGER.info(
+            "Checkpoint appended",
+            stage="save",
+            status="in_progress",
+            checkpoint_file=self._checkpoint_fp.name,
+            appended=len(threads),
+            threads=total,
+        )
+
+    def _save(self, threads: List[Dict[str, Any]], output_file: str) -> None:
+        with open(output_file, "wb") as handle:
+            handle.write(dump_json(threads, indent=True))
         LOGGER.info(
             "Saved output",
             stage="save",
             status="ok",
-            checkpoint=checkpoint,
             output_file=output_file,
             threads=len(threads),
         )
@@ -562,6 +1414,9 @@ class ForumDumper:
         return posted >= self.since_dt
 
     def run(self, output_file: str) -> List[Dict[str, Any]]:
+        return asyncio.run(self.run_async(output_file))
+
+    async def run_async(self, output_file: str) -> List[Dict[str, Any]]:
         run_started = time.time()
         LOGGER.info(
             "Forum dump run started",
@@ -584,34 +1439,72 @@ class ForumDumper:
         threads: List[Dict[str, Any]] = []
         skipped_since = 0
 
-        for index, url in enumerate(urls, 1):
-            LOGGER.info(
-                "Extracting thread",
-                stage="run",
-                status="in_progress",
-                position=index,
-                total=len(urls),
-                url=url,
-            )
-            thread = self.extract_thread(url)
-            if thread.get("error"):
-                threads.append(thread)
-            else:
-                if self._is_after_since(thread):
-                    threads.append(thread)
-                else:
-                    skipped_since += 1
+        # Each worker keeps its own `delay` between page loads, so the aggregate
+        # request rate is concurrency / delay.
+        rate = self.concurrency / self.delay if self.delay > 0 else None
+        self._limiter = ConcurrencyLimiter(self.concurrency, rate)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT_SECONDS)
+        # Checkpoints append one JSON line per kept thread instead of rewriting
+        # the whole array; the file is dropped once the final output is saved.
+        checkpoint_file = output_file + ".jsonl"
+        self._checkpoint_fp = open(checkpoint_file, "wb")
 
-            if index % self.checkpoint_every == 0:
-                self._save(threads, output_file, checkpoint=True)
-
-        self._save(threads, output_file, checkpoint=False)
-
-        resolved = sum(1 for t in threads if t.get("status") == "resolved")
-        unresolved = sum(1 for t in threads if t.get("status") == "unresolved")
-        total_comments = sum(len(t.get("comments", [])) for t in threads)
-        with_accepted = sum(1 for t in threads if t.get("accepted_answer"))
-        errors = sum(1 for t in threads if t.get("error"))
+        try:
+            await self._start_renderer()
+            self._start_parse_pool()
+            async with self._http_session(
+                connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}
+            ) as session:
+                # All URLs are in flight at once (bounded by the task slots and
+                # the fetch limiter). Results land in an index-keyed buffer and
+                # are committed in URL order as contiguous runs complete, so a
+                # slow page only holds back the commit, never the free slots.
+                slots = asyncio.Semaphore(self.concurrency + self.workers)
+                tasks = [
+                    asyncio.ensure_future(self._extract_indexed(slots, session, index, url, len(urls)))
+                    for index, url in enumerate(urls)
+                ]
+                done: Dict[int, Dict[str, Any]] = {}
+                next_index = 0
+                checkpoint_from = 0
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        index, thread = await next_done
+                        done[index] = thread
+                        while next_index in done:
+                            thread = done.pop(next_index)
+                            next_index += 1
+                            if thread.get("error") or self._is_after_since(thread):
+                                threads.append(thread)
+                            else:
+                                skipped_since += 1
+                            if next_index % self.checkpoint_every == 0 or next_index == len(urls):
+                                self._append_checkpoint(threads[checkpoint_from:], len(threads))
+                                checkpoint_from = len(threads)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+        finally:
+            self._stop_parse_pool()
+            await self._stop_renderer()
+            self._checkpoint_fp.close()
+
+        self._save(threads, output_file)
+        os.remove(checkpoint_file)
+
+        resolved = unresolved = total_comments = with_accepted = errors = 0
+        for t in threads:
+            status = t.get("status")
+            if status == "resolved":
+                resolved += 1
+            elif status == "unresolved":
+                unresolved += 1
+            total_comments += len(t.get("comments", ()))
+            if t.get("accepted_answer"):
+                with_accepted += 1
+            if t.get("error"):
+                errors += 1
 
         LOGGER.info(
             "Forum dump run complete",
@@ -648,7 +1541,44 @@ def main() -> None:
     parser.add_argument("--test", type=int, default=None, help="Limit extracted thread URLs")
     parser.add_argument("--output", type=str, required=True, help="Output JSON file path")
     parser.add_argument("--delay", type=float, default=None, help="Delay between page loads")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Max concurrent thread page fetches"
+    )
     parser.add_argument("--since", type=str, default=None, help="Only keep threads on/after date")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Browser workers (Selenium processes or Playwright pages) for JS-rendered pages",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default=None,
+        help="Browser backend for JS-rendered thread pages (default selenium)",
+    )
+    parser.add_argument(
+        "--specialize",
+        action="store_true",
+        help="Generate per-forum extractors with the configured selectors inlined",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Processes parsing fetched HTML (default CPU count; 0 parses in the event loop)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        type=str,
+        default=None,
+        help="SQLite file caching fetched thread pages across runs (e.g. data/intermediate/forum_cache.sqlite)",
+    )
+    parser.add_argument(
+        "--bloom",
+        action="store_true",
+        help="Dedupe harvested URLs with a Bloom filter (for 100k+ links; rare false positives drop a URL)",
+    )
     parser.add_argument(
         "--no-headless", action="store_true", help="Run browser in visible mode"
     )
@@ -665,6 +1595,13 @@ def main() -> None:
         delay=args.delay,
         test_limit=test_limit,
         since=args.since,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        renderer=args.renderer,
+        specialize=args.specialize,
+        parse_workers=args.parse_workers,
+        http_cache=args.http_cache,
+        bloom=args.bloom,
     )
     dumper.run(args.output)
 
@@ -0,0 +1,23 @@
+import json
+import os
+import sys
+
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import forum_dump  # noqa: E402
+
+
+def test_matches_orjson_layout():
+    threads = [{"url": "u", "title": "é", "views": 5, "comments": [], "accepted_answer": None}]
+
+    assert forum_dump.dump_json(threads, indent=True) == orjson.dumps(threads, option=orjson.OPT_INDENT_2)
+    assert forum_dump.dump_json(threads[0]) == orjson.dumps(threads[0])
+
+
+def test_falls_back_for_ints_wider_than_64_bits():
+    thread = {"url": "u", "title": "é", "views": 10**30}
+
+    assert json.loads(forum_dump.dump_json([thread], indent=True)) == [thread]
+    assert json.loads(forum_dump.dump_json(thread)) == thread
@@ -0,0 +1,77 @@
+"""
+The selectolax (lexbor) and BeautifulSoup parse paths must extract identical
+threads; selectolax is the default whenever it is installed.
+"""
+
+import os
+import sys
+
+import orjson
+import pytest
+
+HERE = os.path.dirname(__file__)
+sys.path.insert(0, os.path.dirname(HERE))
+
+import forum_dump  # noqa: E402
+
+pytest.importorskip("selectolax")
+
+CONFIG_PATH = os.path.join(HERE, "..", "..", "..", "..", "config", "forum_sources.json")
+FIXTURE_PATH = os.path.join(HERE, "fixtures", "khoros_thread.html")
+
+
+def _forums():
+    with open(CONFIG_PATH, "rb") as handle:
+        return orjson.loads(handle.read())["forums"]
+
+
+def _extract(forum, html, use_lexbor):
+    extractor = forum_dump.ThreadExtractor(forum["selectors"], forum.get("status_indicators", {}))
+    extractor.use_lexbor = use_lexbor
+    thread = extractor.extract(html, "https://example.com/thread-123", require_content=False)
+    thread.pop("scraped_at")
+    return thread
+
+
+@pytest.mark.parametrize("forum_key", sorted(_forums()))
+def test_fixture_extracts_identically(forum_key):
+    forum = _forums()[forum_key]
+    with open(FIXTURE_PATH, encoding="utf-8") as handle:
+        html = handle.read()
+
+    assert _extract(forum, html, use_lexbor=True) == _extract(forum, html, use_lexbor=False)
+
+
+def test_separator_text_drops_whitespace_only_strings():
+    html = "<div id='d'><p>a</p>\n<p>b <!-- c --> x</p>  </div>"
+    bs4_text = forum_dump.BeautifulSoup(html, forum_dump.HTML_PARSER).select_one("#d")
+    lexbor_text = forum_dump.parse_lexbor(html).select_one("#d")
+
+    assert lexbor_text.get_text(separator="\n", strip=True) == "a\nb\nx"
+    assert lexbor_text.get_text(separator="\n", strip=True) == bs4_text.get_text(separator="\n", strip=True)
+
+
+def test_select_skips_the_context_node():
+    html = '<div class="item label--success" aria-label="12 likes"><span class="label--success">x</span></div>'
+    item = forum_dump.parse_lexbor(html).select_one(".item")
+
+    assert [tag.get_text() for tag in item.select(".label--success")] == ["x"]
+    assert item.select_one('[aria-label*="like"]') is None
+    assert item.select_one(".label--success").get_text() == "x"
+
+
+@pytest.mark.parametrize("use_lexbor", [False, True])
+def test_empty_accepted_markers_mean_never_accepted(use_lexbor):
+    extractor = forum_dump.ThreadExtractor(
+        {"title": "h1", "accepted_marker": []}, {"resolved": ["accepted solution"]}
+    )
+    extractor.use_lexbor = use_lexbor
+    html = (
+        "<h1>T</h1><div class='threaded-reply-item best-answer'>"
+        "<span class='author-info'>a</span><div class='threaded-reply-body-wrapper'>x</div></div>"
+        "<div class='threaded-reply-item'><span class='author-info'>b</span>"
+        "<span class='label-component'>Accepted solution</span></div>"
+    )
+    thread = extractor.extract(html, "u")
+
+    assert [reply["is_accepted"] for reply in thread["comments"]] == [False, True]